@@ -1,15 +1,25 @@
+from contextlib import asynccontextmanager
 
-
+import anyio.to_thread
 from fastapi import FastAPI
 
 # Try importing as module first (for local dev), then as direct import (for container)
 try:
-    from backend.signed_urls import router as signed_router
+    from backend.signed_urls import THREADPOOL_SIZE, router as signed_router, warm_up
 except ImportError:
-    from signed_urls import router as signed_router
+    from signed_urls import THREADPOOL_SIZE, router as signed_router, warm_up
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync handlers share this limiter; signed_urls caps signBlob calls below it
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # Warm credentials and the signBlob connection before serving traffic
+    warm_up()
+    yield
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(signed_router)
 
 
@@ -19,6 +29,18 @@ def main():
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # uvloop + httptools come with uvicorn[standard]; multiple workers need
+    # the app passed as an import string (backend.main when run with -m)
+    module = __spec__.name if __spec__ else "main"
+    uvicorn.run(
+        f"{module}:app",
+        host="0.0.0.0",
+        port=8080,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", "2")),
+    )
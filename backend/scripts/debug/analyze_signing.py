@@ -4,12 +4,6 @@ Test signing the same StringToSign with different methods to debug the issue.
 This will help us understand if iam.Signer is the problem.
 """
 
-import base64
-import hashlib
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.backends import default_backend
-
 string_to_sign = """GOOG4-RSA-SHA256
 20251116T081637Z
 20251116/auto/storage/goog4_request
@@ -15,22 +15,24 @@ host:sna-bucket-001.storage.googleapis.com
 content-type;host
 UNSIGNED-PAYLOAD"""
 
-print("="*80)
-print("CANONICAL REQUEST (without X-Goog-SignedHeaders):")
-print("="*80)
-print(canonical_request)
-print()
 
-hash_value = hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
-print(f"SHA256 Hash: {hash_value}")
-print()
+if __name__ == "__main__":
+    print("="*80)
+    print("CANONICAL REQUEST (without X-Goog-SignedHeaders):")
+    print("="*80)
+    print(canonical_request)
+    print()
 
-string_to_sign = f"""GOOG4-RSA-SHA256
+    hash_value = hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+    print(f"SHA256 Hash: {hash_value}")
+    print()
+
+    string_to_sign = f"""GOOG4-RSA-SHA256
 20251116T045045Z
 20251116/auto/storage/goog4_request
 {hash_value}"""
 
-print("="*80)
-print("STRING TO SIGN:")
-print("="*80)
-print(string_to_sign)
+    print("="*80)
+    print("STRING TO SIGN:")
+    print("="*80)
+    print(string_to_sign)
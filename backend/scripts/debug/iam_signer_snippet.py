@@ -64,10 +64,12 @@ except Exception as e:
     traceback.print_exc()
 '''
 
-print("Code to test iam.Signer:")
-print("="*80)
-print(code)
-print("="*80)
-print()
-print("This code needs to run in Cloud Run or in an environment with google.auth credentials.")
-print("We'll add it to the backend for debugging purposes.")
+
+if __name__ == "__main__":
+    print("Code to test iam.Signer:")
+    print("="*80)
+    print(code)
+    print("="*80)
+    print()
+    print("This code needs to run in Cloud Run or in an environment with google.auth credentials.")
+    print("We'll add it to the backend for debugging purposes.")
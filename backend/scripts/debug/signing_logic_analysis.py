@@ -4,7 +4,9 @@ This would show how google-cloud-storage generates V4 signed URLs if we had a ke
 Since we don't, we can at least understand the process.
 """
 
-print("""
+
+if __name__ == "__main__":
+    print("""
 From google-cloud-storage library, V4 signed URL generation works like this:
 
 1. Get the private key (we don't have direct access to this in Cloud Run)
@@ -60,16 +60,18 @@ UNSIGNED-PAYLOAD""",
 
 target_hash = "73ba499f2b93d4906d452503297e736406027c02f5ce875688f6c984dad875fd"
 
-for i, canonical in enumerate(test_canonical_requests):
-    computed_hash = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
-    print(f"Test {i+1}:")
-    print(f"  Computed: {computed_hash}")
-    print(f"  Target:   {target_hash}")
-    print(f"  Match: {computed_hash == target_hash}")
-    print()
 
-# Let's also check: what if we DON'T include UNSIGNED-PAYLOAD?
-canonical_no_payload = """PUT
+if __name__ == "__main__":
+    for i, canonical in enumerate(test_canonical_requests):
+        computed_hash = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+        print(f"Test {i+1}:")
+        print(f"  Computed: {computed_hash}")
+        print(f"  Target:   {target_hash}")
+        print(f"  Match: {computed_hash == target_hash}")
+        print()
+
+    # Let's also check: what if we DON'T include UNSIGNED-PAYLOAD?
+    canonical_no_payload = """PUT
 /file.jpg
 
 content-type:image/jpeg
@@ -77,8 +79,8 @@ host:sna-bucket-001.storage.googleapis.com
 
 content-type;host"""
 
-computed_hash = hashlib.sha256(canonical_no_payload.encode('utf-8')).hexdigest()
-print("Test (no payload hash):")
-print(f"  Computed: {computed_hash}")
-print(f"  Target:   {target_hash}")
-print(f"  Match: {computed_hash == target_hash}")
+    computed_hash = hashlib.sha256(canonical_no_payload.encode('utf-8')).hexdigest()
+    print("Test (no payload hash):")
+    print(f"  Computed: {computed_hash}")
+    print(f"  Target:   {target_hash}")
+    print(f"  Match: {computed_hash == target_hash}")
@@ -1,19 +1,85 @@
-# backend/signed_urls.py - Enterprise Keyless Signing using google.auth.iam
+# backend/signed_urls.py - Enterprise Keyless Signing using the IAM Credentials signBlob API
 import os
+import logging
 import hashlib
 import base64
-from datetime import timedelta, datetime, timezone
-import uuid
+import json
+import binascii
+import secrets
+import threading
+import time
+import traceback
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import quote
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from google.auth import default
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import AuthorizedSession, Request
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Percent-encoding table for ASCII: everything but the RFC 3986 unreserved
+# characters maps to %XX, matching quote(s, safe='')
+_UNRESERVED = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~"
+)
+_PCT_TABLE = {c: f"%{c:02X}" for c in range(128) if chr(c) not in _UNRESERVED}
+
+
+def _pct(s: str) -> str:
+    """URL-encode a query key or value for V4 signing (same as quote(s, safe=''))."""
+    if s.isascii():
+        return s.translate(_PCT_TABLE)
+    return quote(s, safe='')
+
+
+# CPython binds hashlib.sha256 to OpenSSL (SHA-NI capable) when available;
+# say so if this interpreter fell back to the builtin implementation
+_sha256 = hashlib.sha256
+if _sha256.__name__ != "openssl_sha256":
+    logger.warning("hashlib.sha256 is not OpenSSL-backed; V4 signing will be slower")
+
+# Plain keep-alive session for token refreshes and certificate fetches
+_IAM_SESSION = requests.Session()
+_IAM_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_IAM_REQUEST = Request(session=_IAM_SESSION)
+
+# Sync handlers run on anyio's default thread limiter (40 threads unless
+# raised); main.py raises it to THREADPOOL_SIZE at startup. The semaphore
+# below is what bounds concurrent signBlob RPCs per process: it sits under
+# the threadpool size so cache hits and other sync routes still get a
+# thread while signing is saturated. That only holds when the app's
+# lifespan raises the limiter as main.lifespan does; an app that includes
+# this router without it keeps 40 threads, which then caps signBlob calls
+# instead and this semaphore never blocks. The signBlob connection pool
+# is sized to match, so a burst reuses warm connections instead of
+# opening (and discarding) extra ones.
+THREADPOOL_SIZE = 64
+_SIGN_BLOB_CONCURRENCY = 48
+_sign_blob_slots = threading.BoundedSemaphore(_SIGN_BLOB_CONCURRENCY)
+
+_SIGN_BLOB_URL = "https://iamcredentials.googleapis.com/v1/projects/-/serviceAccounts/{}:signBlob"
+# signBlob is deterministic, so retrying a POST on throttling/5xx is safe
+_SIGN_BLOB_RETRY = Retry(
+    total=3,
+    backoff_factor=0.1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+)
+
+
+_DEFAULT_SERVICE_ACCOUNT_EMAIL = "signed-url@storied-catwalk-476608-d1.iam.gserviceaccount.com"
+
+
+def _service_account_email() -> str:
+    """Return the service account that signs URLs (SERVICE_ACCOUNT_EMAIL)."""
+    return os.environ.get("SERVICE_ACCOUNT_EMAIL", _DEFAULT_SERVICE_ACCOUNT_EMAIL)
 
 
 class SignedURLRequest(BaseModel):
@@ -21,6 +87,20 @@ class SignedURLRequest(BaseModel):
     content_type: Optional[str] = "image/jpeg"
     expires_minutes: Optional[int] = 15
 
+    @field_validator("content_type")
+    @classmethod
+    def _strip_content_type(cls, v: Optional[str]) -> Optional[str]:
+        # V4 canonical headers must be trimmed; do it once here, not per signature
+        return v.strip() if v else v
+
+
+class SignedURLResponse(BaseModel):
+    url: str
+    method: str
+    blob_name: str
+    content_type: str
+    expires_at: str
+
 
 class IAMSigner:
     """Enterprise-grade signer using IAM API for keyless signing.
@@ -38,109 +118,138 @@ class IAMSigner:
     
     def __init__(self, service_account_email: str):
         self.service_account_email = service_account_email
-        # Get the credentials for making IAM API calls
-        self.credentials, _ = default()
+        self._url = _SIGN_BLOB_URL.format(service_account_email)
     
-    def sign_bytes(self, message: bytes) -> bytes:
-        """Sign bytes by calling the IAM signBlob API via HTTP.
+    def sign_bytes_b64(self, message: bytes) -> str:
+        """Sign bytes by calling the IAM Credentials signBlob API.
         
         Args:
             message: Bytes to sign
             
         Returns:
-            Signature bytes (raw RSA-2048-SHA256 signature)
+            The base64 signature exactly as returned in the 'signedBlob' field
             
         Raises:
             HTTPException: If signing fails
         """
         try:
-            import sys
-            import requests
-            
-            credentials, _ = default()
-            request = Request()
-            credentials.refresh(request)
-            
-            # Call IAM Credentials signBlob API  
-            url = f"https://iamcredentials.googleapis.com/v1/projects/-/serviceAccounts/{self.service_account_email}:signBlob"
-            
-            headers = {
-                "Authorization": f"Bearer {credentials.token}",
-                "Content-Type": "application/json",
-            }
-            
-            body = {
-                "payload": base64.b64encode(message).decode('ascii')
-            }
-            
-            print(f"DEBUG: Calling signBlob API for {self.service_account_email}", file=sys.stderr)
-            response = requests.post(url, json=body, headers=headers)
+            # The base64 alphabet needs no JSON escaping, so the one-field
+            # body is assembled directly instead of going through json.dumps
+            body = b'{"payload":"' + base64.b64encode(message) + b'"}'
+            with _sign_blob_slots:
+                response = _get_authed_session().post(self._url, data=body)
             response.raise_for_status()
-            
-            result = response.json()
-            print(f"DEBUG: signBlob response: {result}", file=sys.stderr)
             # The response field is 'signedBlob', not 'signature'
-            signature_b64 = result.get('signedBlob', '')
-            print(f"DEBUG: signature_b64 length: {len(signature_b64)}", file=sys.stderr)
-            
-            # Decode from base64 to get raw bytes
-            signature_bytes = base64.b64decode(signature_b64) if signature_b64 else b''
-            
-            print(f"DEBUG: Got signature ({len(signature_bytes)} bytes)", file=sys.stderr)
-            return signature_bytes
+            return json.loads(response.content)["signedBlob"]
             
         except Exception as e:
-            import sys
-            import traceback
-            print(f"ERROR in IAMSigner.sign_bytes: {e}", file=sys.stderr)
-            traceback.print_exc(file=sys.stderr)
+            logger.exception("IAM signing failed for %s", self.service_account_email)
             raise HTTPException(
                 status_code=500,
                 detail=f"IAM signing failed: {str(e)}"
             )
     
+    def sign_bytes(self, message: bytes) -> bytes:
+        """Sign bytes and return the raw RSA-2048-SHA256 signature.
+        
+        Raises:
+            HTTPException: If signing fails
+        """
+        return base64.b64decode(self.sign_bytes_b64(message))
+    
+    def sign_hex(self, message: bytes) -> str:
+        """Sign bytes and return the signature hex-encoded, as V4 URLs expect.
+        
+        Raises:
+            HTTPException: If signing fails
+        """
+        return binascii.a2b_base64(self.sign_bytes_b64(message)).hex()
+    
     @property
     def signer_email(self) -> str:
         return self.service_account_email
 
 
+@lru_cache(maxsize=1)
+def _get_credentials():
+    """Run Application Default Credentials discovery once per process."""
+    credentials, _ = default()
+    return credentials
+
+
+@lru_cache(maxsize=1)
+def _get_authed_session() -> AuthorizedSession:
+    """Shared session for signBlob calls.
+    
+    AuthorizedSession attaches the bearer token and refreshes it only when
+    it expires; keep-alive means the TLS handshake with
+    iamcredentials.googleapis.com is paid once per connection.
+    """
+    session = AuthorizedSession(_get_credentials(), auth_request=_IAM_REQUEST)
+    session.headers["Content-Type"] = "application/json"
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=_SIGN_BLOB_CONCURRENCY,
+            max_retries=_SIGN_BLOB_RETRY,
+        ),
+    )
+    return session
+
+
+# service_account_email -> IAMSigner; the lock is only taken on a miss, so
+# each service account gets exactly one signer without serializing lookups
+_SIGNERS: dict[str, IAMSigner] = {}
+_signer_lock = threading.Lock()
+
+
+def _get_signer(service_account_email: str) -> IAMSigner:
+    """Return the cached IAMSigner for a service account, creating it on first use."""
+    signer = _SIGNERS.get(service_account_email)
+    if signer is None:
+        with _signer_lock:
+            signer = _SIGNERS.get(service_account_email)
+            if signer is None:
+                signer = _SIGNERS[service_account_email] = IAMSigner(service_account_email)
+    return signer
+
+
 def _build_canonical_request(
     method: str,
     path: str,
-    query_parameters: dict,
+    query_parameters: list[tuple[str, str]],
     headers: dict,
-) -> str:
+) -> tuple[bytes, str]:
     """Build canonical request string per Google V4 signing spec.
     
     All header names must be lowercase in the canonical request.
+    query_parameters must already be sorted by key, e.g.
+    sorted(params.items()).
+    
+    Returns:
+        Tuple of (UTF-8 encoded canonical request, canonical query string).
+        The bytes go straight to _build_string_to_sign; the query string is
+        reused as-is for the final signed URL.
     """
     # 1. Canonical Query String
     # Include all query parameters except X-Goog-Signature (added after signing)
-    canonical_params = {
-        k: v for k, v in query_parameters.items() 
-        if k != "X-Goog-Signature"
-    }
     canonical_query = "&".join(
-        f"{quote(k, safe='')}={quote(str(v), safe='')}" for k, v in sorted(canonical_params.items())
+        f"{_pct(k)}={_pct(v)}"
+        for k, v in query_parameters
+        if k != "X-Goog-Signature"
     )
 
     # 2. Canonical Headers (lowercase keys, sorted)
-    header_lines = []
-    signed_headers = []
-    for k in sorted(headers.keys()):
-        v = headers[k].strip()
-        k_lower = k.lower()
-        signed_headers.append(k_lower)
-        # Format: lowercase_key:value (no space after colon, value stripped)
-        header_lines.append(f"{k_lower}:{v}")
-
-    canonical_headers = "\n".join(header_lines)
-    signed_headers_str = ";".join(signed_headers)
+    # Format: lowercase_key:value (no space after colon, value stripped)
+    pairs = sorted((k.lower(), v.strip()) for k, v in headers.items())
+    canonical_headers = "\n".join(f"{k}:{v}" for k, v in pairs)
+    signed_headers_str = ";".join(k for k, _ in pairs)
 
     # 3. Payload Hash
     payload_hash = "UNSIGNED-PAYLOAD"
 
-    return (
+    canonical_request = (
         f"{method}\n"
         f"{path}\n"
         f"{canonical_query}\n"
@@ -149,25 +258,143 @@ def _build_canonical_request(
         f"{signed_headers_str}\n"
         f"{payload_hash}"
     )
+    return canonical_request.encode('utf-8'), canonical_query
+
+
+def _build_canonical_v4_put(
+    path: str,
+    host: str,
+    content_type: str,
+    quoted_credential: str,
+    timestamp: str,
+    expires: str,
+) -> tuple[bytes, str]:
+    """Build the canonical request for a V4 signed PUT URL.
+    
+    Specialized form of _build_canonical_request for the only shape
+    generate_signed_url_iam produces: the five X-Goog-* query parameters
+    and the content-type/host headers, already in sorted order. The
+    credential must already be URL-encoded (see _get_scope).
+    
+    Returns:
+        Tuple of (UTF-8 encoded canonical request, canonical query string).
+    """
+    canonical_query = (
+        f"X-Goog-Algorithm=GOOG4-RSA-SHA256"
+        f"&X-Goog-Credential={quoted_credential}"
+        f"&X-Goog-Date={timestamp}"
+        f"&X-Goog-Expires={expires}"
+        f"&X-Goog-SignedHeaders=content-type%3Bhost"
+    )
+    canonical_request = (
+        f"PUT\n"
+        f"{path}\n"
+        f"{canonical_query}\n"
+        f"content-type:{content_type}\n"
+        f"host:{host}\n"
+        f"\n"
+        f"content-type;host\n"
+        f"UNSIGNED-PAYLOAD"
+    )
+    return canonical_request.encode('utf-8'), canonical_query
 
 
 def _build_string_to_sign(
-    timestamp: datetime,
+    timestamp: str,
     scope: str,
-    canonical_request: str,
-) -> str:
-    """Build the string to sign for V4 signature."""
-    credential_scope = scope
-    hashed_canonical_request = hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+    canonical_request: bytes,
+) -> bytes:
+    """Build the string to sign for V4 signature.
+    
+    Takes the canonical request as bytes and returns bytes ready for the
+    signer; every component is ASCII so no further encoding is needed.
+    """
+    hashed_canonical_request = _sha256(canonical_request).hexdigest()
     
     return (
         f"GOOG4-RSA-SHA256\n"
-        f"{timestamp.strftime('%Y%m%dT%H%M%SZ')}\n"
-        f"{credential_scope}\n"
+        f"{timestamp}\n"
+        f"{scope}\n"
         f"{hashed_canonical_request}"
+    ).encode('ascii')
+
+
+# Staging-only self check: verify each signature against the service
+# account's published certificates before the URL is returned
+VERIFY_SIGNATURES = os.environ.get("VERIFY_SIGNATURES") == "1"
+_X509_URL = "https://www.googleapis.com/service_accounts/v1/metadata/x509/{}"
+# (connect, read) seconds; requests would otherwise wait forever
+_X509_TIMEOUT = (3.05, 10)
+
+# service_account_email -> RSA public keys from its published certificates
+_PUBKEY_CACHE: dict[str, list] = {}
+
+
+def _load_public_keys(service_account_email: str, refresh: bool = False) -> list:
+    """Fetch and cache the public keys for a service account's signing certs."""
+    keys = None if refresh else _PUBKEY_CACHE.get(service_account_email)
+    if keys is None:
+        # cryptography is only needed when VERIFY_SIGNATURES is on
+        from cryptography import x509
+
+        response = _IAM_SESSION.get(
+            _X509_URL.format(service_account_email),
+            timeout=_X509_TIMEOUT,
+        )
+        response.raise_for_status()
+        keys = [
+            x509.load_pem_x509_certificate(pem.encode('ascii')).public_key()
+            for pem in response.json().values()
+        ]
+        _PUBKEY_CACHE[service_account_email] = keys
+    return keys
+
+
+def _verify_signature(service_account_email: str, message: bytes, signature: bytes) -> None:
+    """Check an RSA-SHA256 signature locally so a bad one never reaches GCS.
+    
+    The service account may have several active keys; all are tried, and
+    the certificates are re-fetched once in case a key was rotated.
+    
+    Raises:
+        HTTPException: If no certificate verifies the signature
+    """
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    for refresh in (False, True):
+        for key in _load_public_keys(service_account_email, refresh):
+            try:
+                key.verify(signature, message, padding.PKCS1v15(), hashes.SHA256())
+                return
+            except InvalidSignature:
+                continue
+    logger.error("Signature from %s failed local verification", service_account_email)
+    raise HTTPException(
+        status_code=500,
+        detail="IAM signature failed local verification"
     )
 
 
+@lru_cache(maxsize=32)
+def _get_scope(service_account_email: str, datestamp: str) -> tuple[str, str]:
+    """Return the credential scope and URL-encoded X-Goog-Credential for a day.
+    
+    Both only change at UTC midnight, so they are computed once per day and
+    service account.
+    """
+    credential_scope = f"{datestamp}/auto/storage/goog4_request"
+    quoted_credential = _pct(f"{service_account_email}/{credential_scope}")
+    return credential_scope, quoted_credential
+
+
+@lru_cache(maxsize=32)
+def _bucket_host(bucket_name: str) -> str:
+    """Return the virtual-hosted GCS host name for a bucket."""
+    return f"{bucket_name}.storage.googleapis.com"
+
+
 def generate_signed_url_iam(
     bucket_name: str,
     blob_name: str,
@@ -178,81 +405,134 @@ def generate_signed_url_iam(
     """Generate a V4 signed URL using IAM API (keyless signing).
     
     Enterprise-secure: No private keys stored. Signing via IAM signBlob.
+    content_type is signed as given, so it must not carry surrounding
+    whitespace (SignedURLRequest strips it).
     """
-    now = datetime.now(timezone.utc)
-    timestamp = now.strftime("%Y%m%dT%H%M%SZ")
-    datestamp = now.strftime("%Y%m%d")
+    # Format the V4 timestamp by hand; strftime is comparatively slow
+    epoch = time.time()
+    t = time.gmtime(epoch)
+    timestamp = (
+        f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}Z"
+    )
+    datestamp = timestamp[:8]
+    expiration_seconds = expiration_minutes * 60
     
     # Credential scope for V4 signing
-    credential_scope = f"{datestamp}/auto/storage/goog4_request"
-    
-    # Query parameters for the signed URL
-    expiration_seconds = expiration_minutes * 60
-    query_parameters = {
-        "X-Goog-Algorithm": "GOOG4-RSA-SHA256",
-        "X-Goog-Credential": f"{service_account_email}/{credential_scope}",
-        "X-Goog-Date": timestamp,
-        "X-Goog-Expires": str(expiration_seconds),
-        "X-Goog-SignedHeaders": "content-type;host",  # ← LOWERCASE!
-    }
+    credential_scope, quoted_credential = _get_scope(service_account_email, datestamp)
+    host = _bucket_host(bucket_name)
     
     # Canonical request
-    # Note: Headers must be lowercase for canonical request
     path = f"/{blob_name}"
-    headers = {
-        "content-type": content_type,
-        "host": f"{bucket_name}.storage.googleapis.com",
-    }
-    
-    canonical_request = _build_canonical_request(
-        "PUT",
+    canonical_request, canonical_query = _build_canonical_v4_put(
         path,
-        query_parameters,
-        headers,
+        host,
+        content_type,
+        quoted_credential,
+        timestamp,
+        str(expiration_seconds),
     )
     
     # String to sign
     string_to_sign = _build_string_to_sign(
-        now,
+        timestamp,
         credential_scope,
         canonical_request,
     )
 
     # Sign using IAM (keyless)
-    signature_bytes = IAMSigner(service_account_email).sign_bytes(string_to_sign.encode('utf-8'))
-    
     # Per Google's V4 signing spec: hex-encode the signature for the URL
-    signature_hex = signature_bytes.hex()
-
-    # Add signature to query params
-    query_parameters["X-Goog-Signature"] = signature_hex
+    signature_hex = _get_signer(service_account_email).sign_hex(string_to_sign)
+    
+    if VERIFY_SIGNATURES:
+        _verify_signature(service_account_email, string_to_sign, bytes.fromhex(signature_hex))
 
     # Build final URL
-    # Use same encoding as canonical query to ensure signature matches
-    query_string = "&".join(
-        f"{quote(k, safe='')}={quote(str(v), safe='')}"
-        for k, v in sorted(query_parameters.items())
-    )
+    # GCS sorts the query itself when verifying, so the hex signature (which
+    # needs no encoding) is simply appended to the canonical query, as
+    # google-cloud-storage does
+    signed_url = f"https://{host}{path}?{canonical_query}&X-Goog-Signature={signature_hex}"
     
-    signed_url = f"https://{bucket_name}.storage.googleapis.com{path}?{query_string}"
-    
-    expires_at = now + timedelta(minutes=expiration_minutes)
+    # The URL stops working X-Goog-Expires seconds after X-Goog-Date
+    et = time.gmtime(int(epoch) + expiration_seconds)
+    expires_at = (
+        f"{et.tm_year:04d}-{et.tm_mon:02d}-{et.tm_mday:02d}"
+        f"T{et.tm_hour:02d}:{et.tm_min:02d}:{et.tm_sec:02d}+00:00"
+    )
     
     return {
         "url": signed_url,
         "method": "PUT",
         "blob_name": blob_name,
         "content_type": content_type,
-        "expires_at": expires_at.isoformat(),
+        "expires_at": expires_at,
     }
 
 
-@router.post("/signed-url")
-async def create_upload_signed_url(req: SignedURLRequest):
+# Short-lived cache of signed URLs for caller-chosen filenames:
+# (bucket, blob_name, content_type, expires_minutes) -> (reuse_until, result)
+_URL_CACHE_MAXSIZE = 10_000
+_url_cache: dict[tuple[str, str, str, int], tuple[float, dict]] = {}
+_url_cache_lock = threading.Lock()
+
+
+def _get_cached_url(key: tuple[str, str, str, int]) -> Optional[dict]:
+    """Return a previously signed URL for key if it may still be reused."""
+    hit = _url_cache.get(key)
+    if hit is None:
+        return None
+    if hit[0] > time.monotonic():
+        return hit[1]
+    # Expired: drop it here rather than scanning the cache on insert
+    with _url_cache_lock:
+        if _url_cache.get(key) is hit:
+            del _url_cache[key]
+    return None
+
+
+def _cache_url(key: tuple[str, str, str, int], result: dict, expires_minutes: int) -> None:
+    """Remember a signed URL until one minute before it expires."""
+    ttl = expires_minutes * 60 - 60
+    if ttl <= 0:
+        return
+    with _url_cache_lock:
+        # Re-inserting moves the key to the newest end of the dict
+        _url_cache.pop(key, None)
+        while len(_url_cache) >= _URL_CACHE_MAXSIZE:
+            # Full: drop the oldest entry in O(1)
+            del _url_cache[next(iter(_url_cache))]
+        _url_cache[key] = (time.monotonic() + ttl, result)
+
+
+def warm_up() -> None:
+    """Prime the signer for the configured service account.
+    
+    Runs default() discovery, the first token refresh and one signBlob
+    round-trip up front so the first /signed-url request does not pay for
+    them. Failures are logged and otherwise ignored.
+    """
+    service_account_email = _service_account_email()
+    try:
+        _get_signer(service_account_email).sign_bytes_b64(b"warmup")
+    except Exception as e:
+        # No traceback here: a signBlob failure was already logged with one
+        logger.warning("Signer warm-up failed for %s: %s", service_account_email, e)
+
+
+@router.post("/signed-url", response_model=SignedURLResponse)
+def create_upload_signed_url(req: SignedURLRequest):
     """Return a V4 signed URL for uploading an object to GCS.
 
     Enterprise-grade keyless implementation using IAM API.
     
+    Declared sync on purpose: signing makes a blocking signBlob call, so
+    FastAPI runs this handler in its threadpool instead of on the event loop.
+    
+    When the caller supplies a filename, the signed URL is cached and
+    returned again for identical requests until a minute before it expires.
+    This trades a fresh URL per call for skipping the IAM round-trip on
+    retries. Auto-generated filenames are unique and never cached.
+    
     Security model:
     - No private keys stored, transmitted, or kept in memory
     - All cryptographic signing done via Google IAM API
@@ -265,14 +545,18 @@ async def create_upload_signed_url(req: SignedURLRequest):
     - roles/storage.objectCreator → on bucket
     """
     bucket_name = os.environ.get("UPLOAD_BUCKET", "sna-bucket-001")
-    service_account_email = os.environ.get(
-        "SERVICE_ACCOUNT_EMAIL",
-        "signed-url@storied-catwalk-476608-d1.iam.gserviceaccount.com"
-    )
+    service_account_email = _service_account_email()
 
     # Generate unique filename if not provided
-    filename = req.filename or f"uploads/{uuid.uuid4().hex}.jpg"
+    filename = req.filename or f"uploads/{secrets.token_hex(16)}.jpg"
     content_type = req.content_type or "application/octet-stream"
+    expires_minutes = req.expires_minutes or 15
+
+    cache_key = (bucket_name, filename, content_type, expires_minutes)
+    if req.filename:
+        cached = _get_cached_url(cache_key)
+        if cached is not None:
+            return cached
 
     try:
         result = generate_signed_url_iam(
@@ -280,8 +564,10 @@ async def create_upload_signed_url(req: SignedURLRequest):
             blob_name=filename,
             service_account_email=service_account_email,
             content_type=content_type,
-            expiration_minutes=req.expires_minutes or 15,
+            expiration_minutes=expires_minutes,
         )
+        if req.filename:
+            _cache_url(cache_key, result, expires_minutes)
         return result
         
     except HTTPException:
@@ -294,10 +580,8 @@ async def create_upload_signed_url(req: SignedURLRequest):
 
 
 @router.get("/debug/identity")
-async def debug_identity():
+def debug_identity():
     """Debug endpoint to check what identity we're running as."""
-    import sys
-    
     try:
         credentials, project_id = default()
         
@@ -306,9 +590,9 @@ async def debug_identity():
         if hasattr(credentials, 'service_account_email'):
             service_account_email = credentials.service_account_email
         
-        print(f"DEBUG: Project ID: {project_id}", file=sys.stderr)
-        print(f"DEBUG: Credentials type: {type(credentials)}", file=sys.stderr)
-        print(f"DEBUG: Service account: {service_account_email}", file=sys.stderr)
+        logger.debug("Project ID: %s", project_id)
+        logger.debug("Credentials type: %s", type(credentials))
+        logger.debug("Service account: %s", service_account_email)
         
         return {
             "project_id": project_id,
@@ -318,23 +602,21 @@ async def debug_identity():
         }
     except Exception as e:
         return {"error": str(e)}
-async def debug_sign():
+
+
+@router.get("/debug/sign")
+def debug_sign():
     """Debug endpoint to test the signing mechanism."""
-    import sys
-    
     test_message = b"Test message for signing"
-    service_account_email = os.environ.get(
-        "SERVICE_ACCOUNT_EMAIL",
-        "signed-url@storied-catwalk-476608-d1.iam.gserviceaccount.com"
-    )
+    service_account_email = _service_account_email()
     
     try:
-        print(f"DEBUG: Signing test message with {service_account_email}", file=sys.stderr)
-        signer = IAMSigner(service_account_email)
-        signature = signer.sign_bytes(test_message)
+        logger.debug("Signing test message with %s", service_account_email)
+        signature = _get_signer(service_account_email).sign_bytes(test_message)
         
-        print(f"DEBUG: Signature type: {type(signature)}", file=sys.stderr)
-        print(f"DEBUG: Signature length: {len(signature)}", file=sys.stderr)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Signature type: %s", type(signature))
+            logger.debug("Signature length: %d", len(signature))
         
         # Base64 encode if bytes
         if isinstance(signature, bytes):
@@ -350,9 +632,8 @@ async def debug_sign():
             "signature_b64_sample": sig_b64[:100] if len(sig_b64) > 100 else sig_b64,
         }
     except Exception as e:
-        import traceback
         error_str = traceback.format_exc()
-        print(f"ERROR in debug_sign: {error_str}", file=sys.stderr)
+        logger.error("debug_sign failed: %s", error_str)
         return {
             "error": str(e),
             "trace": error_str
@@ -0,0 +1,171 @@
+"""
+Lock in the byte-for-byte V4 canonical request format.
+
+ECHOED_CANONICAL_REQUEST is the CanonicalRequest text GCS echoed back in a
+SignatureDoesNotMatch response (see scripts/debug/extract_gcs_canonical.py).
+That response's StringToSign carries the hash b6af122b..., which the echoed
+text does not hash to, so the echo alone does not prove what GCS signs.
+The independent check is google-cloud-storage's own V4 signer, which must
+produce the same string to sign and URL as ours.
+"""
+from urllib.parse import quote
+
+import pytest
+
+import signed_urls
+from signed_urls import (
+    _build_canonical_request,
+    _build_canonical_v4_put,
+    _build_string_to_sign,
+    _bucket_host,
+    _get_scope,
+    _pct,
+)
+
+SERVICE_ACCOUNT_EMAIL = "signed-url@storied-catwalk-476608-d1.iam.gserviceaccount.com"
+TIMESTAMP = "20251116T050034Z"
+
+ECHOED_CANONICAL_REQUEST = (
+    b"PUT\n"
+    b"/test_image_01.jpg\n"
+    b"X-Goog-Algorithm=GOOG4-RSA-SHA256"
+    b"&X-Goog-Credential=signed-url%40storied-catwalk-476608-d1.iam.gserviceaccount.com"
+    b"%2F20251116%2Fauto%2Fstorage%2Fgoog4_request"
+    b"&X-Goog-Date=20251116T050034Z"
+    b"&X-Goog-Expires=900"
+    b"&X-Goog-SignedHeaders=content-type%3Bhost\n"
+    b"content-type:image/jpeg\n"
+    b"host:sna-bucket-001.storage.googleapis.com\n"
+    b"\n"
+    b"content-type;host\n"
+    b"UNSIGNED-PAYLOAD"
+)
+
+
+def test_v4_put_matches_gcs_echo():
+    _, quoted_credential = _get_scope(SERVICE_ACCOUNT_EMAIL, TIMESTAMP[:8])
+    canonical_request, canonical_query = _build_canonical_v4_put(
+        "/test_image_01.jpg",
+        _bucket_host("sna-bucket-001"),
+        "image/jpeg",
+        quoted_credential,
+        TIMESTAMP,
+        "900",
+    )
+
+    assert canonical_request == ECHOED_CANONICAL_REQUEST
+    assert canonical_query == ECHOED_CANONICAL_REQUEST.split(b"\n")[2].decode('ascii')
+
+
+def test_general_builder_matches_gcs_echo():
+    query_parameters = {
+        "X-Goog-Algorithm": "GOOG4-RSA-SHA256",
+        "X-Goog-Credential": f"{SERVICE_ACCOUNT_EMAIL}/20251116/auto/storage/goog4_request",
+        "X-Goog-Date": TIMESTAMP,
+        "X-Goog-Expires": "900",
+        "X-Goog-SignedHeaders": "content-type;host",
+        "X-Goog-Signature": "ignored",
+    }
+    headers = {
+        "Host": "sna-bucket-001.storage.googleapis.com",
+        "Content-Type": " image/jpeg ",
+    }
+
+    canonical_request, _ = _build_canonical_request(
+        "PUT",
+        "/test_image_01.jpg",
+        sorted(query_parameters.items()),
+        headers,
+    )
+
+    assert canonical_request == ECHOED_CANONICAL_REQUEST
+
+
+class _CapturingSigner:
+    """Stands in for IAMSigner / signing credentials and records the message."""
+
+    signer = None
+    signer_email = SERVICE_ACCOUNT_EMAIL
+
+    def sign_bytes(self, message: bytes) -> bytes:
+        self.message = message
+        return bytes.fromhex("ab" * 256)
+
+    def sign_hex(self, message: bytes) -> str:
+        return self.sign_bytes(message).hex()
+
+
+def test_matches_google_cloud_storage(monkeypatch):
+    gcs_signing = pytest.importorskip("google.cloud.storage._signing")
+    from google.auth.credentials import Credentials, Signing
+
+    class ReferenceCredentials(_CapturingSigner, Credentials, Signing):
+        def refresh(self, request):
+            pass
+
+    reference = ReferenceCredentials()
+    expected_url = gcs_signing.generate_signed_url_v4(
+        reference,
+        "/test_image_01.jpg",
+        900,
+        api_access_endpoint="https://sna-bucket-001.storage.googleapis.com",
+        method="PUT",
+        content_type="image/jpeg",
+        _request_timestamp=TIMESTAMP,
+    )
+
+    ours = _CapturingSigner()
+    monkeypatch.setattr(signed_urls, "_get_signer", lambda email: ours)
+    # 2025-11-16T05:00:34Z
+    monkeypatch.setattr(signed_urls.time, "time", lambda: 1763269234.5)
+    result = signed_urls.generate_signed_url_iam(
+        bucket_name="sna-bucket-001",
+        blob_name="test_image_01.jpg",
+        service_account_email=SERVICE_ACCOUNT_EMAIL,
+        content_type="image/jpeg",
+    )
+
+    assert ours.message == reference.message
+    assert result["url"] == expected_url
+    assert result["expires_at"] == "2025-11-16T05:15:34+00:00"
+
+
+def test_string_to_sign():
+    credential_scope, _ = _get_scope(SERVICE_ACCOUNT_EMAIL, TIMESTAMP[:8])
+
+    string_to_sign = _build_string_to_sign(TIMESTAMP, credential_scope, b"canonical")
+
+    assert string_to_sign == (
+        b"GOOG4-RSA-SHA256\n"
+        b"20251116T050034Z\n"
+        b"20251116/auto/storage/goog4_request\n"
+        # sha256(b"canonical")
+        b"0deeb8fa1dbbee4c0dbe7f5e3c9183940139f26d22797ee8ab07c00557a4c2ff"
+    )
+
+
+def test_signed_url_appends_hex_signature(monkeypatch):
+    class StubSigner:
+        def sign_hex(self, message: bytes) -> str:
+            return "ab" * 256
+
+    monkeypatch.setattr(signed_urls, "_get_signer", lambda email: StubSigner())
+
+    result = signed_urls.generate_signed_url_iam(
+        bucket_name="sna-bucket-001",
+        blob_name="test_image_01.jpg",
+        service_account_email=SERVICE_ACCOUNT_EMAIL,
+        content_type="image/jpeg",
+    )
+
+    # Hex needs no percent-encoding, so it is appended verbatim after the
+    # canonical query
+    url, _, signature = result["url"].rpartition("&X-Goog-Signature=")
+    assert signature == "ab" * 256
+    assert url.startswith("https://sna-bucket-001.storage.googleapis.com/test_image_01.jpg?X-Goog-Algorithm=")
+    assert url.endswith("&X-Goog-SignedHeaders=content-type%3Bhost")
+
+
+@pytest.mark.parametrize("s", [chr(c) for c in range(128)] + ["uploads/café ü.jpg"])
+def test_pct_matches_quote(s):
+    assert _pct(s) == quote(s, safe='')
@@ -0,0 +1,87 @@
+"""
+IAMSigner and the shared signBlob session, without calling IAM.
+"""
+import base64
+import json
+
+import google.auth.credentials
+import pytest
+from fastapi import HTTPException
+
+import signed_urls
+from signed_urls import IAMSigner
+
+SERVICE_ACCOUNT_EMAIL = "signed-url@storied-catwalk-476608-d1.iam.gserviceaccount.com"
+SIGNED_BLOB = base64.b64encode(b"\x01\x02\xff").decode('ascii')
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, payload: dict):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode('utf-8')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Records signBlob POSTs and answers with a fixed response."""
+
+    def __init__(self, response: FakeResponse):
+        self.response = response
+        self.posts = []
+
+    def post(self, url, data):
+        self.posts.append((url, data))
+        return self.response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession(FakeResponse(200, {"keyId": "k", "signedBlob": SIGNED_BLOB}))
+    monkeypatch.setattr(signed_urls, "_get_authed_session", lambda: fake)
+    return fake
+
+
+def test_sign_blob_request(session):
+    message = b"GOOG4-RSA-SHA256\n20251116T050034Z"
+
+    assert IAMSigner(SERVICE_ACCOUNT_EMAIL).sign_bytes_b64(message) == SIGNED_BLOB
+
+    [(url, body)] = session.posts
+    assert url == (
+        "https://iamcredentials.googleapis.com/v1/projects/-/serviceAccounts/"
+        f"{SERVICE_ACCOUNT_EMAIL}:signBlob"
+    )
+    payload = base64.b64encode(message)
+    assert body == b'{"payload":"' + payload + b'"}'
+    assert json.loads(body) == {"payload": payload.decode('ascii')}
+
+
+def test_sign_bytes_and_hex_decode_signed_blob(session):
+    signer = IAMSigner(SERVICE_ACCOUNT_EMAIL)
+
+    assert signer.sign_bytes(b"message") == b"\x01\x02\xff"
+    assert signer.sign_hex(b"message") == "0102ff"
+
+
+def test_sign_blob_error(session):
+    session.response = FakeResponse(403, {"error": {"code": 403}})
+
+    with pytest.raises(HTTPException) as exc_info:
+        IAMSigner(SERVICE_ACCOUNT_EMAIL).sign_hex(b"message")
+
+    assert exc_info.value.status_code == 500
+
+
+def test_authed_session_retries_sign_blob(monkeypatch):
+    monkeypatch.setattr(
+        signed_urls, "_get_credentials", google.auth.credentials.AnonymousCredentials
+    )
+    signed_urls._get_authed_session.cache_clear()
+    try:
+        session = signed_urls._get_authed_session()
+        assert session.get_adapter("https://").max_retries is signed_urls._SIGN_BLOB_RETRY
+    finally:
+        signed_urls._get_authed_session.cache_clear()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test the full signing process against the live IAM signBlob API.
+
+Uses the real canonical request / string-to-sign builders from signed_urls.
+Makes real, audited IAM calls, so it only runs with RUN_LIVE_IAM_TESTS=1 and
+Application Default Credentials that may sign as the service account
+(roles/iam.serviceAccountTokenCreator).
+"""
+import os
+
+import pytest
+
+from signed_urls import (
+    _build_canonical_request,
+    _build_string_to_sign,
+    _get_scope,
+    _get_signer,
+    _service_account_email,
+    _verify_signature,
+)
+
+SERVICE_ACCOUNT_EMAIL = _service_account_email()
+
+
+@pytest.mark.skipif(
+    os.environ.get("RUN_LIVE_IAM_TESTS") != "1",
+    reason="calls the live IAM signBlob API; set RUN_LIVE_IAM_TESTS=1",
+)
+def test_signing():
+    pytest.importorskip("cryptography")
+
+    # Test parameters
+    bucket_name = "sna-bucket-001"
+    blob_name = "test_image_01.jpg"
+    content_type = "image/jpeg"
+    timestamp = "20251116T043806Z"
+    credential_scope, _ = _get_scope(SERVICE_ACCOUNT_EMAIL, timestamp[:8])
+
+    query_parameters = [
+        ("X-Goog-Algorithm", "GOOG4-RSA-SHA256"),
+        ("X-Goog-Credential", f"{SERVICE_ACCOUNT_EMAIL}/{credential_scope}"),
+        ("X-Goog-Date", timestamp),
+        ("X-Goog-Expires", "900"),
+        ("X-Goog-SignedHeaders", "content-type;host"),
+    ]
+    headers = {
+        "content-type": content_type,
+        "host": f"{bucket_name}.storage.googleapis.com",
+    }
+
+    canonical_request, _ = _build_canonical_request(
+        "PUT",
+        f"/{blob_name}",
+        query_parameters,
+        headers,
+    )
+    string_to_sign = _build_string_to_sign(
+        timestamp,
+        credential_scope,
+        canonical_request,
+    )
+
+    signature_bytes = _get_signer(SERVICE_ACCOUNT_EMAIL).sign_bytes(string_to_sign)
+
+    # RSA-2048 signature, checked against the service account's certificates
+    assert len(signature_bytes) == 256
+    _verify_signature(SERVICE_ACCOUNT_EMAIL, string_to_sign, signature_bytes)
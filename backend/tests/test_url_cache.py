@@ -0,0 +1,86 @@
+"""
+Behaviour of the signed-URL cache behind POST /signed-url.
+"""
+import pytest
+
+import signed_urls
+from signed_urls import SignedURLRequest, create_upload_signed_url
+
+
+@pytest.fixture
+def signed(monkeypatch):
+    """Replace signing with a counter and start from an empty cache."""
+    calls = []
+
+    def fake_generate(bucket_name, blob_name, service_account_email, content_type, expiration_minutes=15):
+        calls.append(blob_name)
+        return {
+            "url": f"https://{bucket_name}.storage.googleapis.com/{blob_name}?n={len(calls)}",
+            "method": "PUT",
+            "blob_name": blob_name,
+            "content_type": content_type,
+            "expires_at": "2025-11-16T05:15:34+00:00",
+        }
+
+    monkeypatch.setattr(signed_urls, "generate_signed_url_iam", fake_generate)
+    monkeypatch.setattr(signed_urls, "_url_cache", {})
+    return calls
+
+
+def test_same_filename_hits(signed):
+    first = create_upload_signed_url(SignedURLRequest(filename="a.jpg"))
+    second = create_upload_signed_url(SignedURLRequest(filename="a.jpg"))
+
+    assert second == first
+    assert len(signed) == 1
+
+
+@pytest.mark.parametrize("other", [
+    {"content_type": "image/png"},
+    {"expires_minutes": 30},
+])
+def test_different_request_misses(signed, other):
+    create_upload_signed_url(SignedURLRequest(filename="a.jpg"))
+    create_upload_signed_url(SignedURLRequest(filename="a.jpg", **other))
+
+    assert len(signed) == 2
+
+
+def test_generated_filenames_not_cached(signed):
+    first = create_upload_signed_url(SignedURLRequest())
+    second = create_upload_signed_url(SignedURLRequest())
+
+    assert first["blob_name"] != second["blob_name"]
+    assert signed_urls._url_cache == {}
+
+
+def test_short_expiry_not_cached(signed):
+    create_upload_signed_url(SignedURLRequest(filename="a.jpg", expires_minutes=1))
+    create_upload_signed_url(SignedURLRequest(filename="a.jpg", expires_minutes=1))
+
+    assert len(signed) == 2
+    assert signed_urls._url_cache == {}
+
+
+def test_expired_entry_dropped(signed, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(signed_urls.time, "monotonic", lambda: now)
+    create_upload_signed_url(SignedURLRequest(filename="a.jpg"))
+
+    now += 14 * 60
+    create_upload_signed_url(SignedURLRequest(filename="a.jpg"))
+
+    assert len(signed) == 2
+    assert len(signed_urls._url_cache) == 1
+
+
+def test_capacity_bound(signed, monkeypatch):
+    monkeypatch.setattr(signed_urls, "_URL_CACHE_MAXSIZE", 3)
+    for name in ("a", "b", "c", "d"):
+        create_upload_signed_url(SignedURLRequest(filename=f"{name}.jpg"))
+
+    # The oldest entry is evicted first
+    assert [key[1] for key in signed_urls._url_cache] == ["b.jpg", "c.jpg", "d.jpg"]
+
+    create_upload_signed_url(SignedURLRequest(filename="a.jpg"))
+    assert len(signed) == 5
@@ -0,0 +1,89 @@
+"""
+Local signature verification used when VERIFY_SIGNATURES=1.
+"""
+import pytest
+from fastapi import HTTPException
+
+import signed_urls
+from signed_urls import _verify_signature
+
+pytest.importorskip("cryptography")
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+SERVICE_ACCOUNT_EMAIL = "signed-url@storied-catwalk-476608-d1.iam.gserviceaccount.com"
+MESSAGE = b"GOOG4-RSA-SHA256\n20251116T050034Z\n20251116/auto/storage/goog4_request\n4b0c48af"
+
+
+def _new_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _sign(key, message: bytes) -> bytes:
+    return key.sign(message, padding.PKCS1v15(), hashes.SHA256())
+
+
+@pytest.fixture
+def keys(monkeypatch):
+    """Serve public keys from a list; each call records its refresh flag."""
+    served = {"current": [], "refreshed": []}
+    calls = []
+
+    def fake_load(service_account_email, refresh=False):
+        calls.append(refresh)
+        return served["refreshed"] if refresh else served["current"]
+
+    monkeypatch.setattr(signed_urls, "_load_public_keys", fake_load)
+    served["calls"] = calls
+    return served
+
+
+def test_valid_signature(keys):
+    key = _new_key()
+    keys["current"] = [_new_key().public_key(), key.public_key()]
+
+    _verify_signature(SERVICE_ACCOUNT_EMAIL, MESSAGE, _sign(key, MESSAGE))
+
+    assert keys["calls"] == [False]
+
+
+def test_invalid_signature(keys):
+    key = _new_key()
+    keys["current"] = keys["refreshed"] = [key.public_key()]
+
+    with pytest.raises(HTTPException) as exc_info:
+        _verify_signature(SERVICE_ACCOUNT_EMAIL, MESSAGE, _sign(key, MESSAGE + b"x"))
+
+    assert exc_info.value.status_code == 500
+    assert keys["calls"] == [False, True]
+
+
+def test_refreshes_after_key_rotation(keys):
+    rotated = _new_key()
+    keys["current"] = [_new_key().public_key()]
+    keys["refreshed"] = [rotated.public_key()]
+
+    _verify_signature(SERVICE_ACCOUNT_EMAIL, MESSAGE, _sign(rotated, MESSAGE))
+
+    assert keys["calls"] == [False, True]
+
+
+def test_certificate_fetch_has_timeout(monkeypatch):
+    seen = {}
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {}
+
+    def fake_get(url, **kwargs):
+        seen.update(kwargs)
+        return FakeResponse()
+
+    monkeypatch.setattr(signed_urls._IAM_SESSION, "get", fake_get)
+    monkeypatch.setattr(signed_urls, "_PUBKEY_CACHE", {})
+
+    assert signed_urls._load_public_keys(SERVICE_ACCOUNT_EMAIL) == []
+    assert seen["timeout"] == signed_urls._X509_TIMEOUT